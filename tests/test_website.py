@@ -24,6 +24,22 @@ class TestWebsite(unittest.TestCase):
 
         self.assertIs(site.result, result, "'set_result' doesn't work")
 
+    def testEquality(self):
+        other = Website("www.example.com", "https://example.com/{}", Category.VIDEO)
+
+        self.assertEqual(site, other, "Sites with the same domain and URL should be equal")
+        self.assertEqual(hash(site), hash(other))
+        self.assertNotEqual(site, Website("www.example.org", "https://example.com/{}", 0))
+
+    def testClone(self):
+        site.set_result(Result(site, 200, True, 5, "", ""))
+        clone = site.clone()
+
+        self.assertIsNot(clone, site)
+        self.assertIsNone(clone.result, "The result shouldn't be cloned")
+        self.assertIs(clone.category.website, clone)
+        self.assertEqual(clone.username, site.username)
+
     def testRequestCoro(self):
         self.assertTrue(iscoroutine(site.send_request(object)), "'send_request' should return a coro")
 
@@ -1,10 +1,70 @@
-from tracer import WebsitePool, Website
+from tracer import WebsitePool, Website, close_default_session
+from tracer.models.websitepool import _get_default_session
+from unittest.mock import patch
+from aiohttp import ClientTimeout
 import unittest
+import warnings
+import asyncio
+import copy
+import gc
 
 
 pool = WebsitePool()
 
 
+class FakeResponse:
+    status = 200
+    host = "example.com"
+    url = "https://example.com/"
+
+    def __init__(self, session, delay):
+        self.session = session
+        self.delay = delay
+
+    async def __aenter__(self):
+        if self.session.error is not None:
+            raise self.session.error
+
+        self.session.active += 1
+        self.session.peak = max(self.session.peak, self.session.active)
+
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.session.active -= 1
+
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def close(self):
+        pass
+
+    async def wait_for_close(self):
+        pass
+
+
+class FakeSession:
+    """Answers the n-th request after `delays[n]` seconds (the last
+    delay is used for any further request) and records the passed
+    timeouts and the peak amount of requests in flight. If `error`
+    is set, every request raises it instead"""
+
+    def __init__(self, *delays, error=None):
+        self.delays = delays or (0.0,)
+        self.error = error
+        self.timeouts = []
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url, timeout=None):
+        delay = self.delays[min(len(self.timeouts), len(self.delays) - 1)]
+        self.timeouts.append(timeout)
+
+        return FakeResponse(self, delay)
+
+
 class TestWebsitePool(unittest.TestCase):
     def testAdding(self):
         site = Website("www.example.com", "", 10)
@@ -16,6 +76,46 @@ class TestWebsitePool(unittest.TestCase):
 
         self.assertNotIn(site, pool, "Removed website is still in the pool")
 
+    def testDuplicates(self):
+        site = Website("www.example.com", "", 10)
+        pool_ = WebsitePool(site, site)
+
+        self.assertEqual(len(pool_), 1, "Duplicate website got added to the pool")
+
+        copied = copy.deepcopy(pool_)
+
+        self.assertIn(copied.sites[0], copied, "Copied website is not in the copied pool")
+        self.assertNotIn(site, copied, "Original website is in the copied pool")
+
+    def testExtend(self):
+        site = Website("www.example.com", "", 10)
+        pool_ = WebsitePool(site)
+        other = WebsitePool(site, Website("www.example.org", "", 10))
+
+        pool_.extend(other, _deepcopy=False)
+
+        self.assertEqual(len(pool_), 2, "Site that is already in the pool got added again")
+        self.assertIn(other.sites[1], pool_)
+
+        pool_.extend(other, _deepcopy=False)
+
+        self.assertEqual(len(pool_), 2)
+
+        # Copies are new objects and hence always added
+        pool_.extend(other)
+        pool_.extend(other)
+
+        self.assertEqual(len(pool_), 6)
+        self.assertTrue(all(copied not in other for copied in pool_.sites[2:]),
+                        "Extend should add copies of the sites")
+
+    def testGetByName(self):
+        first = Website("www.example.com", "", 10)
+        pool_ = WebsitePool(first, Website("www.example.org", "", 10))
+
+        self.assertIs(pool_.get_by_name("www"), first, "The first matching website should be returned")
+        self.assertIsNone(pool_.get_by_name("tracer"))
+
     def testIterable(self):
         try:
             for _ in pool:
@@ -29,6 +129,7 @@ class TestWebsitePool(unittest.TestCase):
         pool.set_name(name)
 
         self.assertEqual(pool.name, name, "Setting the name for the pool didn't work")
+        self.assertIn(repr(name), str(pool), "The str representation didn't get updated")
 
     def testSetUsername(self):
         pool.add(Website("www.example.com", "https://example.com/{}", 0))
@@ -39,6 +140,245 @@ class TestWebsitePool(unittest.TestCase):
 
         pool.remove(lambda website: website.username == 'tracerino')
 
+    def testStartRequests(self):
+        sites = [Website(f"www.example{i}.com", "https://example.com/{}", 0, err_on_dot=True)
+                 for i in range(3)]
+        pool_ = WebsitePool(*sites)
+        pool_.set_username("tracer.ino")
+
+        async def collect():
+            return [result async for result in pool_.start_requests(object())]
+
+        results = asyncio.run(collect())
+
+        self.assertEqual(len(results), 3)
+        self.assertCountEqual([id(result.website) for result in results], map(id, sites))
+
+    def testCollectResults(self):
+        sites = [Website(f"www.example{i}.com", "https://example.com/{}", 0, err_on_dot=True)
+                 for i in range(3)]
+        pool_ = WebsitePool(*sites)
+        pool_.set_username("tracer.ino")
+
+        results = asyncio.run(pool_.collect_results(object()))
+
+        self.assertEqual([result.website for result in results], sites)
+
+    def testStopConsumingEarly(self):
+        pool_ = WebsitePool(*[Website(f"www.example{i}.com", "https://example.com/{}", 0)
+                              for i in range(100)])
+        pool_.set_username("tracerino")
+
+        async def consume():
+            # The fast responses fill up the queue while
+            # the slow requests are still in flight
+            requests = pool_.start_requests(FakeSession(*[0.0] * 50, 10.0))
+
+            async for _ in requests:
+                # Let a waiting request take the place of the result
+                await asyncio.sleep(0.01)
+                break
+
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+
+            await requests.aclose()
+            await asyncio.sleep(0.05)
+
+            # asyncio.run would cancel left over tasks itself
+            return [task.cancelled() for task in tasks]
+
+        cancelled = asyncio.run(consume())
+
+        self.assertTrue(cancelled)
+        self.assertTrue(all(cancelled), "Pending requests should be cancelled cleanly")
+
+    def testBackpressure(self):
+        pool_ = WebsitePool(*[Website(f"www.example{i}.com", "https://example.com/{}", 0)
+                              for i in range(200)])
+        pool_.set_username("tracerino")
+
+        async def consume():
+            session = FakeSession()
+            requests = pool_.start_requests(session, concurrency=5)
+            sent = []
+
+            async for _ in requests:
+                # Pause the consumer after the first result
+                for _ in range(2):
+                    await asyncio.sleep(0.05)
+                    sent.append(len(session.timeouts))
+
+                break
+
+            await requests.aclose()
+
+            return sent
+
+        sent = asyncio.run(consume())
+
+        self.assertEqual(sent[0], sent[1], "Requests are sent while the consumer is paused")
+        # 5 requests in flight + 50 buffered results + the consumed one
+        self.assertLessEqual(sent[0], 5 + 50 + 1)
+
+    def testDefaultSession(self):
+        pool_ = WebsitePool(Website("www.example.com", "", 0, err_on_dot=True))
+        pool_.set_username("tracer.ino")
+
+        async def collect():
+            return [result async for result in pool_.start_requests()]
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+
+            # The second run replaces the session of the first loop
+            asyncio.run(collect())
+            asyncio.run(collect())
+            asyncio.run(close_default_session())
+            gc.collect()
+
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [],
+                         "The shared session didn't get closed")
+
+    def testConcurrency(self):
+        pool_ = WebsitePool(*[Website(f"www.example{i}.com", "https://example.com/{}", 0)
+                              for i in range(10)])
+        pool_.set_username("tracerino")
+
+        async def stream(session, concurrency):
+            requests = pool_.start_requests(session, concurrency=concurrency)
+
+            return [result async for result in requests]
+
+        for collect in (stream, pool_.collect_results):
+            session = FakeSession(0.01)
+            results = asyncio.run(collect(session, concurrency=3))
+
+            self.assertEqual(len(results), 10)
+            self.assertEqual(session.peak, 3, "More requests than allowed were in flight")
+
+            session = FakeSession(0.01)
+            asyncio.run(collect(session, concurrency=None))
+
+            self.assertEqual(session.peak, 10, "All requests should be in flight at once")
+
+    def testTimeout(self):
+        pool_ = WebsitePool(*[Website(f"www.example{i}.com", "https://example.com/{}", 0)
+                              for i in range(3)])
+        pool_.set_username("tracerino")
+
+        for timeout, expected in (
+            (30, ClientTimeout(total=30, sock_connect=10, sock_read=30)),
+            (5, ClientTimeout(total=5, sock_connect=5, sock_read=5)),
+            (None, ClientTimeout()),
+        ):
+            session = FakeSession()
+            asyncio.run(pool_.collect_results(session, timeout))
+
+            self.assertEqual(session.timeouts[0], expected)
+            self.assertTrue(all(t is session.timeouts[0] for t in session.timeouts),
+                            "The timeout should be built once for all requests")
+
+    def testWebsiteTimeout(self):
+        site = Website("www.example.com", "https://example.com/{}", 0)
+        site.set_username("tracerino")
+        timeout = ClientTimeout(total=3)
+        session = FakeSession()
+
+        asyncio.run(site.send_request(session, timeout))
+        asyncio.run(site.send_request(session, 3))
+
+        self.assertIs(session.timeouts[0], timeout, "A ClientTimeout should be used as is")
+        self.assertEqual(session.timeouts[1], ClientTimeout(total=3))
+
+    def testConcurrentDefaultSession(self):
+        async def get_sessions():
+            return await asyncio.gather(_get_default_session(), _get_default_session())
+
+        async def close_sessions(sessions):
+            await close_default_session()
+
+            return all(session.closed for session in sessions)
+
+        # The second loop has to replace the session of the first one
+        first = asyncio.run(get_sessions())
+        second = asyncio.run(get_sessions())
+
+        self.assertIs(second[0], second[1], "Concurrent callers got different sessions")
+        self.assertTrue(asyncio.run(close_sessions(first + second)))
+
+    def testResultCache(self):
+        pool_ = WebsitePool(Website("www.example.com", "", 0, err_on_dot=True), cache_ttl=60)
+        pool_.set_username("tracer.ino")
+
+        async def collect():
+            return [result async for result in pool_.start_requests(object())]
+
+        first = asyncio.run(collect())
+
+        self.assertIs(asyncio.run(collect())[0], first[0], "Cached result didn't get reused")
+
+        pool_.clear_cache()
+
+        self.assertIsNot(asyncio.run(collect())[0], first[0], "Result is still cached")
+
+    def testResultCacheExpiry(self):
+        pool_ = WebsitePool(Website("www.example.com", "", 0, err_on_dot=True), cache_ttl=60)
+        pool_.set_username("tracer.ino")
+
+        with patch("tracer.models.websitepool.monotonic", return_value=0):
+            first = asyncio.run(pool_.collect_results(object()))
+
+        with patch("tracer.models.websitepool.monotonic", return_value=60):
+            self.assertIs(asyncio.run(pool_.collect_results(object()))[0], first[0])
+
+        with patch("tracer.models.websitepool.monotonic", return_value=61):
+            self.assertIsNot(asyncio.run(pool_.collect_results(object()))[0], first[0],
+                             "Expired result got reused")
+
+    def testResultCacheFailures(self):
+        pool_ = WebsitePool(Website("www.example.com", "https://example.com/{}", 0), cache_ttl=60)
+        pool_.set_username("tracerino")
+
+        for error in (asyncio.TimeoutError(), ValueError()):
+            pool_.clear_cache()
+
+            first = asyncio.run(pool_.collect_results(FakeSession(error=error)))
+            second = asyncio.run(pool_.collect_results(FakeSession()))
+
+            self.assertTrue(first[0].timeout or first[0].error)
+            self.assertIsNot(second[0], first[0], "Failed result got cached")
+
+    def testResultCacheSize(self):
+        sites = [Website(f"www.example{i}.com", "", 0, err_on_dot=True) for i in range(3)]
+        pool_ = WebsitePool(*sites, cache_ttl=60, cache_size=2)
+        pool_.set_username("tracer.ino")
+
+        first = asyncio.run(pool_.collect_results(object()))
+
+        # Only the results of the last two sites fit into the cache
+        pool_.remove(lambda w: w is sites[0])
+        pool_.add(sites[0])
+
+        second = asyncio.run(pool_.collect_results(object()))
+
+        self.assertIs(second[0], first[1])
+        self.assertIs(second[1], first[2])
+        self.assertIsNot(second[2], first[0], "The oldest result didn't get evicted")
+
+    def testResultCacheKey(self):
+        sites = [Website("a.com", "https://a.com/u/{}", 0, err_on_dot=True),
+                 Website("a.com", "https://a.com/p/{}", 0, err_on_dot=True)]
+        pool_ = WebsitePool(*sites, cache_ttl=60)
+        pool_.set_username("x.y")
+
+        asyncio.run(pool_.collect_results(object()))
+        results = asyncio.run(pool_.collect_results(object()))
+
+        self.assertEqual([result.url for result in results],
+                         ["https://a.com/u/x.y", "https://a.com/p/x.y"],
+                         "Sites of the same domain share a cached result")
+        self.assertIs(sites[1].result.website, sites[1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -131,12 +131,9 @@ class Category(AbstractCategory):
             representation.
         """
 
-        try:
-            return [
-                key for key, val in cls.__dict__.items() if val == number
-            ][0]
-        except IndexError:
-            return "UNKNOWN"
+        return next(
+            (key for key, val in cls.__dict__.items() if val == number), "UNKNOWN"
+        )
 
     @classmethod
     def all_categories(cls) -> List[str]:
@@ -30,7 +30,7 @@ from typing import Any, Callable, Coroutine, Dict, Optional, Union
 from abc import ABC, abstractmethod
 from asyncio import TimeoutError
 from time import monotonic
-from copy import deepcopy
+from copy import copy, deepcopy
 import asyncio
 import re
 
@@ -105,10 +105,12 @@ class Website(AbstractWebsite):
         checked
     obj.set_result(tracer.Result)
         Sets a result for the website
-    obj.send_request(ClientSession, Optional[float], Optional[Callable])
+    obj.clone() -> tracer.Website
+        Returns a copy of the website without a result
+    obj.send_request(ClientSession, Optional[Union[float, ClientTimeout]], Optional[Callable]) -> tracer.Result
         Sends a HTTP GET request to the website and checks if
-        the username exists. Then creates a `tracer.Result` object
-        and assigns it to itself by using `obj.set_result`
+        the username exists. Then creates a `tracer.Result` object,
+        assigns it to itself by using `obj.set_result` and returns it
 
     Classmethods
     ------------
@@ -122,7 +124,9 @@ class Website(AbstractWebsite):
         Returns the str representation of the website
     `x == obj`
         Compares if `(1):` the other object is a `tracer.Website`
-        object and if `(2):` the values are the same
+        object and if `(2):` the domain and the URL are the same
+    `hash(obj)`
+        Returns the hash of the domain and the URL
     `copy.copy(obj)`
         Returns a copy of the website
     `copy.deepcopy(obj)`
@@ -218,6 +222,7 @@ class Website(AbstractWebsite):
         self.__result = None
         self.__category = Category(self, category)
         self.__domain = domain
+        self.__hash = hash((domain, true_url))
 
         self.err_ignore_code = err_ignore_code
         self.err_text_pattern = err_text_pattern
@@ -230,7 +235,14 @@ class Website(AbstractWebsite):
                 f"category={self.category}, result={self.result})>")
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+        if not isinstance(other, self.__class__):
+            return False
+
+        return (self.__hash == other.__hash and self.__domain == other.__domain
+                and self.__true_url == other.__true_url)
+
+    def __hash__(self) -> int:
+        return self.__hash
 
     def __copy__(self) -> Website:
         website = self.__class__.__new__(self.__class__)
@@ -292,6 +304,25 @@ class Website(AbstractWebsite):
 
         self.__username = username
 
+    def clone(self) -> Website:
+        """Creates a copy of the website without its result
+
+        Faster than `copy.deepcopy` as the immutable values,
+        like the URLs and the regex patterns, are shared with
+        the clone.
+
+        Returns
+        -------
+        tracer.Website
+            The clone
+        """
+
+        website = copy(self)
+        website.__category = Category(website, int(self.__category))
+        website.__result = None
+
+        return website
+
     def set_result(self, result: Result) -> None:
         """Sets a result
 
@@ -306,24 +337,31 @@ class Website(AbstractWebsite):
     async def send_request(
         self,
         session: ClientSession,
-        timeout: Optional[float] = None,
+        timeout: Optional[Union[float, ClientTimeout]] = None,
         cb: Optional[Callable[[Result], Union[Coroutine, Any]]] = None
-    ) -> None:
+    ) -> Result:
         """Sends a GET requests and evaluates the response
 
         Parameters
         ----------
         session : ClientSession
             ClientSession to use for the GET request
-        timeout : Optional[float], optional
+        timeout : Optional[Union[float, ClientTimeout]], optional
             How many seconds the request has before a
-            TimeoutError occurs, by default None
+            TimeoutError occurs. A prebuilt ClientTimeout
+            is used as is, by default None
         cb : Optional[Callable[[Result], Union[Coroutine, Any]]], optional
             Any callable object that gets called when
             the result is available. It should only
             take in one parameter which is the result,
             by default None
 
+        Returns
+        -------
+        tracer.Result
+            The result of the request, which also gets
+            assigned to the website
+
         Raises
         ------
         TypeError
@@ -336,22 +374,24 @@ class Website(AbstractWebsite):
             )
 
         if "." in self.username and self.err_on_dot:
-            self.set_result(
-                result=Result(
-                    website=self,
-                    status_code=400,
-                    successfully=False,
-                    delay=0,
-                    host=self.domain,
-                    url=self.url
-                )
+            result = Result(
+                website=self,
+                status_code=400,
+                successfully=False,
+                delay=0,
+                host=self.domain,
+                url=self.url
             )
 
+            self.set_result(result)
+
             await self.__callback(cb)
 
-            return None
+            return result
+
+        if not isinstance(timeout, ClientTimeout):
+            timeout = ClientTimeout(timeout)
 
-        timeout = ClientTimeout(timeout)
         start = monotonic()
 
         try:
@@ -387,12 +427,12 @@ class Website(AbstractWebsite):
                 url=self.url,
                 error=e
             )
-        finally:
-            self.set_result(result)
+
+        self.set_result(result)
 
         await self.__callback(cb)
 
-        return None
+        return result
 
     async def __user_exists(self, response: ClientResponse) -> bool:
         """Check based on the returned response if the username is in use.
@@ -414,8 +454,6 @@ class Website(AbstractWebsite):
         if not (response.status == 200 or self.err_ignore_code):
             return False
 
-        await asyncio.sleep(0)
-
         if self.err_url_pattern:
             if re.search(self.err_url_pattern, str(response.url), flags=re.I):
                 return False
@@ -437,8 +475,6 @@ class Website(AbstractWebsite):
         if not callable(callback):
             return None
 
-        await asyncio.sleep(0)
-
         if asyncio.iscoroutinefunction(callback):
             return await callback(self.result)
 
@@ -24,7 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
-__all__ = ("WebsitePool",)
+__all__ = ("WebsitePool", "close_default_session")
 
 from abc import ABC, abstractmethod
 from typing import (
@@ -33,18 +33,110 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Iterable,
+    List,
+    Set,
     Tuple,
     Optional
 )
+from collections import OrderedDict
+from contextlib import suppress
+from time import monotonic
 import asyncio
 import copy
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from .website import Website
 from .result import Result
 
 
+_SENTINEL = object()
+
+_default_session: Optional[ClientSession] = None
+_default_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_default_session() -> ClientSession:
+    """Return a session that is shared by every pool
+
+    The session is created lazily and gets recreated if it was
+    closed or belongs to another event loop. Its connector keeps
+    connections alive and caches DNS lookups so that repeated
+    executions of a pool don't pay the handshake costs again.
+    """
+
+    global _default_session, _default_session_loop
+
+    loop = asyncio.get_running_loop()
+
+    if (_default_session is not None and not _default_session.closed
+            and _default_session_loop is loop):
+        return _default_session
+
+    connector = TCPConnector(
+        limit=100,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+
+    # The new session is assigned before the old one gets closed,
+    # hence concurrent callers can't create a second session
+    session, old = ClientSession(connector=connector), _default_session
+    _default_session, _default_session_loop = session, loop
+
+    await _close_session(old)
+
+    return session
+
+
+async def close_default_session() -> None:
+    """Close the session that is shared by every pool
+
+    The shared session is used by `WebsitePool.start_requests` and
+    `WebsitePool.collect_results` if no session is passed to them.
+    Call this before the event loop shuts down. A new session is
+    created the next time it is needed.
+    """
+
+    global _default_session, _default_session_loop
+
+    session, _default_session = _default_session, None
+    _default_session_loop = None
+
+    await _close_session(session)
+
+
+async def _close_session(session: Optional[ClientSession]) -> None:
+    """Close the given session if it is still open"""
+
+    if session is None or session.closed:
+        return None
+
+    # The session might belong to an event loop that is already
+    # closed, in which case its connections can't be closed
+    # gracefully anymore
+    with suppress(RuntimeError):
+        await session.close()
+
+
+def _build_timeout(timeout: Optional[float]) -> ClientTimeout:
+    """Build the timeout that is shared by all requests of a pool
+
+    Connecting may take at most 10 seconds of the given timeout.
+    """
+
+    if not timeout:
+        return ClientTimeout()
+
+    return ClientTimeout(
+        total=timeout,
+        sock_connect=min(timeout, 10),
+        sock_read=timeout
+    )
+
+
 class AbstractWebsitePool(ABC):
     @property
     @abstractmethod
@@ -86,8 +178,14 @@ class WebsitePool(AbstractWebsitePool):
         Adds a website to the pool
     obj.remove(Callable[[tracer.Website], bool])
         Removes websites from the pool
-    obj.start_requests(aiohttp.ClientSession, Optional[float])
-        Calls `send_request` of every site inside of the pool
+    obj.clear_cache()
+        Drops all cached results
+    obj.start_requests(Optional[aiohttp.ClientSession], Optional[float], Optional[int])
+        Calls `send_request` of every site inside of the pool and
+        yields the results as soon as they are available
+    obj.collect_results(Optional[aiohttp.ClientSession], Optional[float], Optional[int]) -> List[tracer.Result]
+        Calls `send_request` of every site inside of the pool and
+        returns all results at once
 
     Supported Operations
     --------------------
@@ -115,7 +213,9 @@ class WebsitePool(AbstractWebsitePool):
         self,
         *sites: Website,
         name: Optional[str] = None,
-        allow_duplicates: bool = False
+        allow_duplicates: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024
     ):
         """Initialize a WebsitePool
 
@@ -126,20 +226,39 @@ class WebsitePool(AbstractWebsitePool):
         allow_duplicates : bool
             Whether to allow duplicate websites in the pool
             or don't, by default False
+        cache_ttl : float, optional
+            For how many seconds the result of a request is
+            reused by `start_requests` and `collect_results`
+            instead of sending the same request again. Results of requests that
+            timed out or failed are never reused. If None,
+            then no results are cached, by default None
+        cache_size : int
+            How many results are cached at most. If the cache
+            is full, then the least recently used result gets
+            dropped, by default 1024
         """
 
         self.__sites = list()
+        self.__sites_cache: Optional[Tuple[Website, ...]] = None
+        self.__str_cache: Optional[str] = None
+        self.__index: Set[int] = set()
         self.__allow_duplicates = allow_duplicates
+        self.__cache_ttl = cache_ttl
+        self.__cache_size = cache_size
+        self.__results_cache: OrderedDict[Tuple[str, str], Tuple[float, Result]] = OrderedDict()
         self.__name = None
 
         self.set_name(name)
 
-        for site in sites:
-            self.add(site)
+        self.__sites.extend(self.__accept(sites))
+        self.__index.update(map(id, self.__sites))
 
     def __str__(self) -> str:
-        return (f"<{self.__class__.__qualname__}(name={self.__name!r}, "
-                f"websites={len(self)})>")
+        if self.__str_cache is None:
+            self.__str_cache = (f"<{self.__class__.__qualname__}(name={self.__name!r}, "
+                                f"websites={len(self)})>")
+
+        return self.__str_cache
 
     def __len__(self) -> int:
         return len(self.__sites)
@@ -148,12 +267,18 @@ class WebsitePool(AbstractWebsitePool):
         yield from self.__sites
 
     def __contains__(self, obj: Any) -> bool:
-        return isinstance(obj, Website) and any(obj is website for website in self)
+        return isinstance(obj, Website) and id(obj) in self.__index
 
     def __copy__(self) -> WebsitePool:
         pool = self.__class__.__new__(self.__class__)
         pool.__dict__.update(self.__dict__)
 
+        # Don't share the mutable containers, otherwise the
+        # cached tuple of one pool gets stale
+        pool.__sites = list(self.__sites)
+        pool.__index = set(self.__index)
+        pool.__results_cache = OrderedDict(self.__results_cache)
+
         return pool
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> WebsitePool:
@@ -161,14 +286,26 @@ class WebsitePool(AbstractWebsitePool):
 
         memo[id(self)] = pool
 
-        for k, v in self.__dict__.items():
-            setattr(pool, k, copy.deepcopy(v, memo))
+        # Only the sites need to be copied, the other
+        # attributes are immutable
+        pool.__name = self.__name
+        pool.__allow_duplicates = self.__allow_duplicates
+        pool.__cache_ttl = self.__cache_ttl
+        pool.__cache_size = self.__cache_size
+        pool.__sites = [copy.deepcopy(site, memo) for site in self.__sites]
+        pool.__sites_cache = None
+        pool.__str_cache = None
+        pool.__index = {id(site) for site in pool.__sites}
+        pool.__results_cache = copy.deepcopy(self.__results_cache, memo)
 
         return pool
 
     @property
-    def sites(self) -> Tuple[Website]:
-        return tuple(self.__sites)
+    def sites(self) -> Tuple[Website, ...]:
+        if self.__sites_cache is None:
+            self.__sites_cache = tuple(self.__sites)
+
+        return self.__sites_cache
 
     @property
     def name(self) -> Optional[str]:
@@ -176,7 +313,7 @@ class WebsitePool(AbstractWebsitePool):
 
     @property
     def results(self) -> Tuple[Result]:
-        return tuple([site.result for site in self if site.result])
+        return tuple(site.result for site in self.__sites if site.result)
 
     @property
     def is_empty(self) -> bool:
@@ -192,6 +329,7 @@ class WebsitePool(AbstractWebsitePool):
         """
 
         self.__name = name
+        self.__str_cache = None
 
     def set_username(self, username: str, /) -> None:
         """Sets the username for every website within the pool
@@ -202,7 +340,7 @@ class WebsitePool(AbstractWebsitePool):
             The username to set for every website
         """
 
-        for site in self.sites:
+        for site in self.__sites:
             site.set_username(username)
 
     def add(self, website: Website) -> None:
@@ -218,6 +356,8 @@ class WebsitePool(AbstractWebsitePool):
             return None
 
         self.__sites.append(website)
+        self.__index.add(id(website))
+        self.__invalidate()
 
     def extend(self, pool: WebsitePool, _deepcopy: bool = True) -> None:
         """Adds sites from another pool to the own pool
@@ -227,13 +367,41 @@ class WebsitePool(AbstractWebsitePool):
         pool : tracer.WebsitePool
             The pool from which to take the sites
         _deepcopy : bool
-            Whether to generate copies of the sites and
-            add these or add the original sites, by
-            default True
+            Whether to add clones of the sites (see
+            `tracer.Website.clone`) or the original
+            sites, by default True
+
+        Note
+        ----
+        Like `add`, duplicates are detected by identity. Clones
+        are new objects, so they are always added. Only the
+        original sites are skipped if they are already in the pool
         """
 
-        for site in pool:
-            self.add(copy.deepcopy(site) if _deepcopy else site)
+        if _deepcopy:
+            sites = [site.clone() for site in pool.__sites]
+        else:
+            sites = self.__accept(pool.__sites)
+
+        self.__sites.extend(sites)
+        self.__index.update(map(id, sites))
+        self.__invalidate()
+
+    def __accept(self, sites: Iterable[Website]) -> List[Website]:
+        """Returns the sites that may be added to the pool"""
+
+        if self.__allow_duplicates:
+            return list(sites)
+
+        accepted = list()
+        seen = set(self.__index)
+
+        for site in sites:
+            if id(site) not in seen:
+                seen.add(id(site))
+                accepted.append(site)
+
+        return accepted
 
     def remove(self, where: Callable[[Website], bool]) -> None:
         """Removes websites from the pool
@@ -246,7 +414,80 @@ class WebsitePool(AbstractWebsitePool):
             website will be removed.
         """
 
-        self.__sites = list(filter(lambda w: not where(w), self.sites))
+        self.__sites = [site for site in self.__sites if not where(site)]
+        self.__index = {id(site) for site in self.__sites}
+        self.__invalidate()
+
+    def __invalidate(self) -> None:
+        """Drops the values that depend on the sites in the pool"""
+
+        self.__sites_cache = None
+        self.__str_cache = None
+
+    def clear_cache(self) -> None:
+        """Drops all cached results"""
+
+        self.__results_cache.clear()
+
+    def __cached_result(self, site: Website) -> Optional[Result]:
+        """Returns the cached result of the site if it is still valid"""
+
+        if self.__cache_ttl is None:
+            return None
+
+        key = (site.domain, site.true_url)
+        entry = self.__results_cache.get(key)
+
+        if entry is None:
+            return None
+
+        if monotonic() - entry[0] > self.__cache_ttl:
+            del self.__results_cache[key]
+
+            return None
+
+        self.__results_cache.move_to_end(key)
+
+        return entry[1]
+
+    def __cache_result(self, site: Website, result: Result) -> None:
+        """Stores the result of the site if caching is enabled"""
+
+        if self.__cache_ttl is None or result.timeout or result.error:
+            return None
+
+        key = (site.domain, site.true_url)
+
+        self.__results_cache[key] = (monotonic(), result)
+        self.__results_cache.move_to_end(key)
+
+        while len(self.__results_cache) > self.__cache_size:
+            self.__results_cache.popitem(last=False)
+
+    async def __request(
+        self,
+        site: Website,
+        session: ClientSession,
+        timeout: ClientTimeout,
+        semaphore: asyncio.Semaphore
+    ) -> Result:
+        """Sends the request of the site unless a cached result is available
+
+        Used by `collect_results`, `start_requests` checks the
+        cache before it creates a task for the site.
+        """
+
+        if (cached := self.__cached_result(site)) is not None:
+            site.set_result(cached)
+
+            return cached
+
+        async with semaphore:
+            result = await site.send_request(session, timeout)
+
+        self.__cache_result(site, result)
+
+        return result
 
     def get(self, where: Callable[[Website], bool]) -> Tuple[Website]:
         """Retrieves websites from the pool
@@ -265,7 +506,7 @@ class WebsitePool(AbstractWebsitePool):
             callable
         """
 
-        return tuple(filter(where, self))
+        return tuple([site for site in self.__sites if where(site)])
 
     def get_by_name(self, name: str, /) -> Optional[Website]:
         """Retrieves a website by its name
@@ -282,29 +523,38 @@ class WebsitePool(AbstractWebsitePool):
             found
         """
 
-        result = self.get(lambda w: w.name == name)
-
-        return result[0] if result else None
+        return next((site for site in self.__sites if site.name == name), None)
 
     async def start_requests(
         self,
-        session: ClientSession,
-        timeout: Optional[float] = None
+        session: Optional[ClientSession] = None,
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None
     ) -> AsyncGenerator[Result, None]:
         """Prepares and handles all requests
 
         Calls `send_request` of every tracer.Website object in the pool and
         returns an AsyncGenerator yielding the results of these
-        requests when available.
+        requests when available. Use `collect_results` if the
+        results are only needed once all requests are done.
 
         Parameters
         ----------
-        session : aiohttp.ClientSession
+        session : aiohttp.ClientSession, optional
             A session object which gets used to make the
-            requests.
+            requests. If None, then a session that is shared
+            across all pools is used (see
+            `close_default_session`), by default None
         timeout : Union[int, float], optional
             Represents the time each request has before a
-            TimeoutError occurs.
+            TimeoutError occurs. Connecting may take at most
+            10 seconds of it.
+        concurrency : int, optional
+            The maximum amount of requests that are in flight
+            at the same time. New requests are only sent while
+            the consumer keeps up with the results. If None,
+            then all requests are started at once, by default
+            None
 
         Returns
         -------
@@ -317,13 +567,108 @@ class WebsitePool(AbstractWebsitePool):
             The representation of the result of a request
         """
 
-        results = asyncio.Queue()
-        requests = asyncio.gather(*[
-            site.send_request(session, timeout, cb=results.put) for site in self
-        ])
+        if session is None:
+            session = await _get_default_session()
+
+        client_timeout = _build_timeout(timeout)
+
+        # Together with the concurrency limit, the bounded queue makes
+        # the requests wait for a slow consumer. At most `concurrency`
+        # requests are in flight and `maxsize` results are buffered
+        results: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(16, len(self) // 4))
+        semaphore = asyncio.Semaphore(concurrency or len(self) or 1)
+        cached_results: List[Result] = list()
+        tasks: List[asyncio.Future[None]] = list()
 
-        while not (results.empty() and requests.done()):
+        async def produce(site: Website) -> None:
+            # The cache was already checked when the task got created
+            async with semaphore:
+                result = await site.send_request(session, client_timeout)
+                self.__cache_result(site, result)
+
+                # The slot is only released once the result is queued,
+                # hence a slow consumer also slows down the requests
+                await results.put(result)
+
+        async def finalize() -> None:
             try:
-                yield await asyncio.wait_for(results.get(), timeout=0.25)
-            except asyncio.TimeoutError:
-                """Force recheck of the loop condition"""
+                await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                # The consumer is gone, nobody waits for the sentinel
+                raise
+            except Exception:
+                await results.put(_SENTINEL)
+                raise
+
+            await results.put(_SENTINEL)
+
+        for site in self.__sites:
+            # Cached results don't need a task of their own
+            if (cached := self.__cached_result(site)) is not None:
+                site.set_result(cached)
+                cached_results.append(cached)
+            else:
+                tasks.append(asyncio.ensure_future(produce(site)))
+
+        requests = asyncio.ensure_future(finalize())
+
+        try:
+            for result in cached_results:
+                yield result
+
+            while (result := await results.get()) is not _SENTINEL:
+                yield result
+
+            await requests
+        finally:
+            # Producers would block forever on a full queue if
+            # the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+            requests.cancel()
+
+    async def collect_results(
+        self,
+        session: Optional[ClientSession] = None,
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Result]:
+        """Sends all requests and returns their results at once
+
+        Unlike `start_requests`, the results are not streamed
+        but returned in the order of the sites in the pool as
+        soon as every request is done.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession, optional
+            A session object which gets used to make the
+            requests. If None, then a session that is shared
+            across all pools is used (see
+            `close_default_session`), by default None
+        timeout : Union[int, float], optional
+            Represents the time each request has before a
+            TimeoutError occurs. Connecting may take at most
+            10 seconds of it.
+        concurrency : int, optional
+            The maximum amount of requests that are in flight
+            at the same time. If None, then all requests are
+            started at once, by default None
+
+        Returns
+        -------
+        List[tracer.Result]
+            The results of the requests
+        """
+
+        if session is None:
+            session = await _get_default_session()
+
+        client_timeout = _build_timeout(timeout)
+        semaphore = asyncio.Semaphore(concurrency or len(self) or 1)
+
+        return list(await asyncio.gather(*[
+            self.__request(site, session, client_timeout, semaphore)
+            for site in self.__sites
+        ]))